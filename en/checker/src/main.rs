@@ -12,6 +12,7 @@ use prost::Message;
 use std::{
     collections::hash_map::DefaultHasher,
     env,
+    fmt::Write,
     hash::{Hash, Hasher},
     path::PathBuf,
     str::FromStr,
@@ -72,7 +73,7 @@ fn message_id(msg: &gossipsub::Message) -> gossipsub::MessageId {
 }
 
 fn create_test_message(
-    peer_id: &PeerId,
+    peer_id: &str,
     counter: usize,
 ) -> Result<(gossipsub::IdentTopic, UniversalConnectivityMessage)> {
     // Send a test message on the universal-connectivity topic
@@ -105,29 +106,26 @@ fn split_address(addr: Multiaddr) -> Option<(PeerId, Multiaddr)> {
     peer_id.map(|id| (id, base_addr))
 }
 
+fn parse_multiaddrs_from_env(name: &str) -> Result<Vec<Multiaddr>> {
+    let Ok(addrs) = env::var(name) else {
+        return Ok(Vec::default());
+    };
+
+    Ok(addrs
+        .split(',') // Split the string at ','
+        .map(str::trim) // Trim whitespace of each string
+        .filter(|s| !s.is_empty()) // Filter out empty strings
+        .map(Multiaddr::from_str) // Parse each string into Multiaddr
+        .collect::<Result<Vec<_>, _>>()?) // Collect into Result and unwrap it
+}
+
 #[tokio::main]
 async fn main() -> Result<()> {
-    // parse the remote peer addresses from the environment variable
-    let mut listen_on: Vec<Multiaddr> = Vec::default();
-    if let Ok(listen_addrs) = env::var("LISTEN_ADDRS") {
-        listen_on = listen_addrs
-            .split(',') // Split the string at ','
-            .map(str::trim) // Trim whitespace of each string
-            .filter(|s| !s.is_empty()) // Filter out empty strings
-            .map(Multiaddr::from_str) // Parse each string into Multiaddr
-            .collect::<Result<Vec<_>, _>>()?; // Collect into Result and unwrap it
-    }
+    // parse the listen addresses from the environment variable
+    let listen_on = parse_multiaddrs_from_env("LISTEN_ADDRS")?;
 
     // parse the bootstrap peer addresses from the environment variable
-    let mut bootstrap_addrs: Vec<Multiaddr> = Vec::default();
-    if let Ok(bootstrap_peers) = env::var("BOOTSTRAP_PEERS") {
-        bootstrap_addrs = bootstrap_peers
-            .split(',') // Split the string at ','
-            .map(str::trim) // Trim whitespace of each string
-            .filter(|s| !s.is_empty()) // Filter out empty strings
-            .map(Multiaddr::from_str) // Parse each string into Multiaddr
-            .collect::<Result<Vec<_>, _>>()?; // Collect into Result and unwrap it
-    }
+    let bootstrap_addrs = parse_multiaddrs_from_env("BOOTSTRAP_PEERS")?;
 
     // parse environment flags
     let close_after_connected: bool = env::var("CLOSE_AFTER_CONNECTED").is_ok();
@@ -140,6 +138,8 @@ async fn main() -> Result<()> {
     // get our identity
     let local_key = read_identity().await?;
     let local_peer_id = local_key.public().to_peer_id();
+    // base58 encode our peer id once instead of for every test message
+    let local_peer_id_str = local_peer_id.to_string();
 
     // Create a Gossipsub configuration
     let gossipsub_config = gossipsub::ConfigBuilder::default()
@@ -247,7 +247,7 @@ async fn main() -> Result<()> {
                     } else {
                         println!("closed,{peer_id}");
                     }
-                    if shutdown && swarm.network_info().num_peers() == 0 {
+                    if shutdown && swarm.connected_peers().next().is_none() {
                         println!("nomorepeers");
                         break 'run Ok(());
                     }
@@ -331,14 +331,16 @@ async fn main() -> Result<()> {
                                         println!("error,bootstrap timed out");
                                     }
                                     kad::QueryResult::GetClosestPeers(Ok(kad::GetClosestPeersOk { peers, .. })) => {
-                                        println!("kademlia,closestpeers,{}", peers.len());
+                                        // build all of the lines first so they go out in a single write
+                                        let mut out = format!("kademlia,closestpeers,{}\n", peers.len());
                                         for peer in &peers {
-                                            let mut out = format!("closestpeer,{}", peer.peer_id);
+                                            let _ = write!(out, "closestpeer,{}", peer.peer_id);
                                             for addr in &peer.addrs {
-                                                out = format!("{out},{addr}");
+                                                let _ = write!(out, ",{addr}");
                                             }
-                                            println!("{out}");
+                                            out.push('\n');
                                         }
+                                        print!("{out}");
                                     }
                                     kad::QueryResult::GetClosestPeers(Err(kad::GetClosestPeersError::Timeout { .. })) => {
                                         println!("error,get closest peers timed out");
@@ -347,12 +349,12 @@ async fn main() -> Result<()> {
                                 }
                             }
                             kad::Event::RoutingUpdated { peer, is_new_peer, old_peer, .. } => {
-                                let mut out = "kademlia,routing_update".to_string();
+                                let mut out = String::from("kademlia,routing_update");
                                 if is_new_peer {
-                                    out = format!("{out},new {peer}");
+                                    let _ = write!(out, ",new {peer}");
                                 }
                                 if let Some(old) = old_peer {
-                                    out = format!("{out},replaced {old}")
+                                    let _ = write!(out, ",replaced {old}");
                                 }
                                 println!("{out}");
                             }
@@ -371,9 +373,9 @@ async fn main() -> Result<()> {
             _ = timer.tick() => {
                 if chatty {
                     counter += 1;
-                    let (topic, msg) = create_test_message(&local_peer_id, counter)?;
-                    let mut buf = Vec::new();
-                    msg.encode(&mut buf)?;
+                    let (topic, msg) = create_test_message(&local_peer_id_str, counter)?;
+                    // sized to encoded_len() up front so the buffer is allocated once
+                    let buf = msg.encode_to_vec();
                     if let Err(error) = swarm.behaviour_mut().gossipsub.publish(topic, buf) {
                         println!("error,{error}");
                     }
@@ -0,0 +1,58 @@
+"""
+Helpers shared by the lesson check scripts.
+Maps the lesson logs and validates the peer IDs and multiaddrs that the check scripts pull out of them.
+"""
+
+import os
+import re
+import mmap
+
+# matches any character outside of the base58 alphabet used by peer IDs
+NON_BASE58_PATTERN = re.compile(r"[^123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz]")
+
+# matches a well formed Ed25519 peer ID: the 12D3KooW prefix followed by base58, 45-60 chars in total
+PEER_ID_PATTERN = re.compile(r"12D3KooW[1-9A-HJ-NP-Za-km-z]{37,52}")
+
+# matches the first non-whitespace character in a log
+CONTENT_PATTERN = re.compile(rb"\S")
+
+def map_log(path):
+    """Map a log file read-only so that the bytes patterns can scan it without copying it into memory"""
+    with open(path, "rb") as f:
+        # mmap refuses to map an empty file
+        if not os.fstat(f.fileno()).st_size:
+            return b""
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+def validate_peer_id(peer_id_str):
+    """Validate that the peer ID string is a valid libp2p PeerId format"""
+    # Fast path - a well formed peer ID passes all of the checks below in a single match
+    if PEER_ID_PATTERN.fullmatch(peer_id_str):
+        return True, f"{peer_id_str}"
+
+    # Basic format validation - should start with 12D3KooW (Ed25519 peer IDs)
+    if not peer_id_str.startswith("12D3KooW"):
+        return False, f"Invalid peer ID format. Expected to start with '12D3KooW', got: {peer_id_str}"
+
+    # Length check - valid peer IDs should be around 52-55 characters
+    if len(peer_id_str) < 45 or len(peer_id_str) > 60:
+        return False, f"Peer ID length seems invalid. Expected 45-60 chars, got {len(peer_id_str)}: {peer_id_str}"
+
+    # Character set validation - should only contain base58 characters
+    invalid_char = NON_BASE58_PATTERN.search(peer_id_str)
+    if invalid_char:
+        return False, f"Invalid character '{invalid_char.group()}' in peer ID. Must be base58 encoded."
+
+    return True, f"{peer_id_str}"
+
+def validate_multiaddr(addr_str):
+    """Validate that the address string looks like a valid multiaddr"""
+    # Basic multiaddr validation - should start with /ip4/ or /ip6/
+    if not addr_str.startswith(("/ip4/", "/ip6/")):
+        return False, f"Invalid multiaddr format: {addr_str}"
+
+    # Should contain /tcp for TCP transport or /quic-v1 for QUIC transport
+    if not ("/tcp" in addr_str or "/quic-v1" in addr_str):
+        return False, f"Missing TCP or QUIC transport in multiaddr: {addr_str}"
+
+    return True, f"{addr_str}"